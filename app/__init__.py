@@ -20,15 +20,54 @@ investment decisions in the German market, including property search,
 financial analysis, legal guidance, and market insights.
 """
 
-from .agent import root_agent
+import sys
+from types import ModuleType
+from typing import Any
+
 from .config import config
 
 # Version info
 __version__ = "1.0.0"
 __author__ = "ImmoAssist Team"
 
-# Main agent export for Google ADK
-agent = root_agent
+
+def __getattr__(name: str) -> Any:
+    """
+    Build the agent graph on first access to ``root_agent``.
+
+    Importing the package (e.g. for ``config`` or a single tool module) no
+    longer constructs every specialist agent up front.
+    """
+    if name == "root_agent":
+        from .agent import root_agent
+
+        # Cache so later lookups skip this hook
+        globals()["root_agent"] = root_agent
+        return root_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _ImmoAssistPackage(ModuleType):
+    """
+    Package module type keeping ``app.agent`` bound to the root agent.
+
+    Importing the ``app.agent`` submodule makes the import system assign the
+    submodule to the package's ``agent`` attribute. The property below keeps
+    ``agent`` meaning the root Agent (main export for Google ADK) whichever
+    is imported first; the submodule stays reachable via ``sys.modules``.
+    """
+
+    @property
+    def agent(self) -> Any:
+        return self.root_agent
+
+    @agent.setter
+    def agent(self, value: Any) -> None:
+        # Ignore the submodule binding done by the import system
+        pass
+
+
+sys.modules[__name__].__class__ = _ImmoAssistPackage
 
 # Public API
 __all__ = ["agent", "root_agent", "config"]
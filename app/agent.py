@@ -47,6 +47,7 @@ from .tools.integration_tools import generate_audio_elevenlabs, send_email
 from .tools.knowledge_tools import search_knowledge_base
 from .tools.property_tools import (
     calculate_investment_return,
+    calculate_investment_return_batch,
     get_property_details,
     search_properties,
 )
@@ -98,7 +99,11 @@ calculator_specialist = Agent(
     model=config.specialist_model or "gemini-2.5-flash",
     name="CalculatorSpecialist",
     instruction=CALCULATOR_SPECIALIST_PROMPT,
-    tools=[calculate_investment_return, get_current_berlin_time],
+    tools=[
+        calculate_investment_return,
+        calculate_investment_return_batch,
+        get_current_berlin_time,
+    ],
     include_contents="default",  # Ensure conversation context is included
 )
 
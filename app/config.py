@@ -10,10 +10,28 @@ import os
 import logging
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
-from dotenv import load_dotenv
+
+_dotenv_loaded = False
+
+
+def load_environment() -> None:
+    """
+    Load variables from ``.env`` into the process environment once.
+
+    Set ``IMMOASSIST_SKIP_DOTENV`` (e.g. in Cloud Run or test runs where the
+    environment is injected) to skip reading the file altogether.
+    """
+    global _dotenv_loaded
+    if _dotenv_loaded or os.getenv("IMMOASSIST_SKIP_DOTENV"):
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    _dotenv_loaded = True
+
 
 # Load environment variables first
-load_dotenv()
+load_environment()
 
 # Set default location to fix region mismatch issues
 os.environ.setdefault("GOOGLE_CLOUD_LOCATION", "europe-west3")
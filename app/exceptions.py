@@ -72,7 +72,11 @@ class ImmoAssistException(Exception):
         self.user_message = user_message or "Ein unerwarteter Fehler ist aufgetreten."
         self.agent_name = agent_name
         self.timestamp = datetime.utcnow()
-        self.stack_trace = traceback.format_exc()
+        # Formatting the active traceback is the costliest part of building an
+        # exception and only critical errors report it (see to_dict)
+        self.stack_trace: str | None = (
+            traceback.format_exc() if severity == ErrorSeverity.CRITICAL else None
+        )
 
         # Auto-log critical errors
         if severity == ErrorSeverity.CRITICAL:
@@ -91,9 +95,7 @@ class ImmoAssistException(Exception):
             "user_message": self.user_message,
             "agent_name": self.agent_name,
             "timestamp": self.timestamp.isoformat(),
-            "stack_trace": (
-                self.stack_trace if self.severity == ErrorSeverity.CRITICAL else None
-            ),
+            "stack_trace": self.stack_trace,
         }
 
 
@@ -116,7 +118,7 @@ class ValidationError(ImmoAssistException):
             "invalid_value": str(invalid_value) if invalid_value is not None else None,
             "expected_format": expected_format,
         }
-        context.update(kwargs.get("context", {}))
+        context.update(kwargs.pop("context", None) or {})
 
         super().__init__(
             message=message,
@@ -125,7 +127,8 @@ class ValidationError(ImmoAssistException):
             severity=ErrorSeverity.LOW,
             context=context,
             recoverable=True,
-            user_message=f"Ungültige Eingabe für {field_name}: {message}",
+            user_message=kwargs.pop("user_message", None)
+            or f"Ungültige Eingabe für {field_name}: {message}",
             **kwargs,
         )
 
@@ -137,7 +140,8 @@ class PropertyValidationError(ValidationError):
         super().__init__(
             message=message,
             field_name=property_field,
-            user_message=f"Fehler bei Immobiliendaten: {message}",
+            user_message=kwargs.pop("user_message", None)
+            or f"Fehler bei Immobiliendaten: {message}",
             **kwargs,
         )
 
@@ -149,7 +153,8 @@ class FinancialValidationError(ValidationError):
         super().__init__(
             message=message,
             field_name=financial_field,
-            user_message=f"Fehler bei Finanzberechnung: {message}",
+            user_message=kwargs.pop("user_message", None)
+            or f"Fehler bei Finanzberechnung: {message}",
             **kwargs,
         )
 
@@ -162,7 +167,7 @@ class BusinessLogicError(ImmoAssistException):
 
     def __init__(self, message: str, rule_name: str, **kwargs: Any) -> None:
         context = {"rule_name": rule_name}
-        context.update(kwargs.get("context", {}))
+        context.update(kwargs.pop("context", None) or {})
 
         super().__init__(
             message=message,
@@ -170,7 +175,8 @@ class BusinessLogicError(ImmoAssistException):
             category=ErrorCategory.BUSINESS_LOGIC,
             severity=ErrorSeverity.MEDIUM,
             context=context,
-            user_message=f"Geschäftsregel verletzt: {message}",
+            user_message=kwargs.pop("user_message", None)
+            or f"Geschäftsregel verletzt: {message}",
             **kwargs,
         )
 
@@ -179,11 +185,15 @@ class InvestmentCriteriaError(BusinessLogicError):
     """Raised when investment criteria are not met."""
 
     def __init__(self, message: str, criteria: list[str], **kwargs: Any) -> None:
+        context: dict[str, Any] = {"failed_criteria": criteria}
+        context.update(kwargs.pop("context", None) or {})
+
         super().__init__(
             message=message,
             rule_name="investment_criteria",
-            context={"failed_criteria": criteria},
-            user_message=f"Investitionskriterien nicht erfüllt: {message}",
+            context=context,
+            user_message=kwargs.pop("user_message", None)
+            or f"Investitionskriterien nicht erfüllt: {message}",
             **kwargs,
         )
 
@@ -207,7 +217,7 @@ class ExternalAPIError(ImmoAssistException):
             "status_code": status_code,
             "api_response": api_response,
         }
-        context.update(kwargs.get("context", {}))
+        context.update(kwargs.pop("context", None) or {})
 
         # Determine if retryable based on status code
         retryable = status_code is None or status_code >= 500 or status_code == 429
@@ -225,7 +235,8 @@ class ExternalAPIError(ImmoAssistException):
             context=context,
             recoverable=retryable,
             retry_after_seconds=retry_seconds,
-            user_message=f"Externe API {api_name} ist temporär nicht verfügbar.",
+            user_message=kwargs.pop("user_message", None)
+            or f"Externe API {api_name} ist temporär nicht verfügbar.",
             **kwargs,
         )
 
@@ -237,7 +248,8 @@ class PropertyAPIError(ExternalAPIError):
         super().__init__(
             message=message,
             api_name="property_search",
-            user_message="Immobiliensuche temporär nicht verfügbar.",
+            user_message=kwargs.pop("user_message", None)
+            or "Immobiliensuche temporär nicht verfügbar.",
             **kwargs,
         )
 
@@ -249,7 +261,8 @@ class ElevenLabsAPIError(ExternalAPIError):
         super().__init__(
             message=message,
             api_name="elevenlabs",
-            user_message="Sprachsynthese temporär nicht verfügbar.",
+            user_message=kwargs.pop("user_message", None)
+            or "Sprachsynthese temporär nicht verfügbar.",
             **kwargs,
         )
 
@@ -264,7 +277,7 @@ class AgentError(ImmoAssistException):
         self, message: str, agent_name: str, operation: str, **kwargs: Any
     ) -> None:
         context = {"agent_name": agent_name, "operation": operation}
-        context.update(kwargs.get("context", {}))
+        context.update(kwargs.pop("context", None) or {})
 
         super().__init__(
             message=message,
@@ -273,7 +286,8 @@ class AgentError(ImmoAssistException):
             severity=ErrorSeverity.HIGH,
             context=context,
             agent_name=agent_name,
-            user_message="Ein interner Fehler ist aufgetreten. Bitte versuchen Sie es erneut.",
+            user_message=kwargs.pop("user_message", None)
+            or "Ein interner Fehler ist aufgetreten. Bitte versuchen Sie es erneut.",
             **kwargs,
         )
 
@@ -284,12 +298,16 @@ class AgentTimeoutError(AgentError):
     def __init__(
         self, agent_name: str, operation: str, timeout_seconds: int, **kwargs: Any
     ) -> None:
+        context: dict[str, Any] = {"timeout_seconds": timeout_seconds}
+        context.update(kwargs.pop("context", None) or {})
+
         super().__init__(
             message=f"Agent {agent_name} timed out during {operation} after {timeout_seconds}s",
             agent_name=agent_name,
             operation=operation,
-            context={"timeout_seconds": timeout_seconds},
-            user_message="Die Anfrage dauert länger als erwartet. Bitte versuchen Sie es erneut.",
+            context=context,
+            user_message=kwargs.pop("user_message", None)
+            or "Die Anfrage dauert länger als erwartet. Bitte versuchen Sie es erneut.",
             **kwargs,
         )
 
@@ -298,12 +316,16 @@ class AgentCommunicationError(AgentError):
     """Raised when agents fail to communicate."""
 
     def __init__(self, source_agent: str, target_agent: str, **kwargs: Any) -> None:
+        context: dict[str, Any] = {"target_agent": target_agent}
+        context.update(kwargs.pop("context", None) or {})
+
         super().__init__(
             message=f"Communication failed between {source_agent} and {target_agent}",
             agent_name=source_agent,
             operation="agent_communication",
-            context={"target_agent": target_agent},
-            user_message="Interner Kommunikationsfehler. Bitte versuchen Sie es erneut.",
+            context=context,
+            user_message=kwargs.pop("user_message", None)
+            or "Interner Kommunikationsfehler. Bitte versuchen Sie es erneut.",
             **kwargs,
         )
 
@@ -316,7 +338,7 @@ class ConfigurationError(ImmoAssistException):
 
     def __init__(self, message: str, config_key: str, **kwargs: Any) -> None:
         context = {"config_key": config_key}
-        context.update(kwargs.get("context", {}))
+        context.update(kwargs.pop("context", None) or {})
 
         super().__init__(
             message=message,
@@ -325,7 +347,8 @@ class ConfigurationError(ImmoAssistException):
             severity=ErrorSeverity.CRITICAL,
             context=context,
             recoverable=False,
-            user_message="Systemkonfigurationsfehler. Bitte kontaktieren Sie den Support.",
+            user_message=kwargs.pop("user_message", None)
+            or "Systemkonfigurationsfehler. Bitte kontaktieren Sie den Support.",
             **kwargs,
         )
 
@@ -422,11 +445,13 @@ def safe_execute(
             structured_exception = handle_exception(
                 func_name=operation, exception=e, agent_name=agent_name, context=context
             )
-            log_error(
-                structured_exception,
-                context=structured_exception.to_dict(),
-                agent_name=agent_name,
-            )
+            # Critical errors already logged themselves on construction
+            if structured_exception.severity != ErrorSeverity.CRITICAL:
+                log_error(
+                    structured_exception,
+                    context=structured_exception.to_dict(),
+                    agent_name=agent_name,
+                )
             raise structured_exception from e
 
     return wrapper
@@ -7,16 +7,51 @@ monitoring, and observability.
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import logging.config
+import queue
 import sys
-from datetime import datetime
+import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any
 
 from .config import config
 
+# Standard LogRecord attributes that are not copied into the JSON entry as
+# extra fields; built once instead of on every formatted record
+_RESERVED_RECORD_FIELDS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "message",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+    }
+)
+
+# Shared compact encoder: json.dumps builds a new JSONEncoder on every call
+# whenever non-default options are passed
+_encode_log_entry = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
 
 class StructuredFormatter(logging.Formatter):
     """
@@ -24,12 +59,27 @@ class StructuredFormatter(logging.Formatter):
     Provides consistent, machine-readable log format.
     """
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") of the last record;
+        # replaced as one tuple so handlers on other threads never see a mix
+        self._second_prefix: tuple[int, str] = (-1, "")
+
+    def _format_timestamp(self, created: float) -> str:
+        """Render a record's creation time as ISO 8601 UTC with a Z suffix."""
+        second = int(created)
+        cached_second, prefix = self._second_prefix
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second_prefix = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1_000_000):06d}Z"
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as structured JSON."""
 
         # Base log structure
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -49,35 +99,11 @@ class StructuredFormatter(logging.Formatter):
             log_entry["exception"] = self.formatException(record.exc_info)
 
         # Add any extra fields from the record
-        excluded_fields = {
-            "name",
-            "msg",
-            "args",
-            "levelname",
-            "levelno",
-            "pathname",
-            "filename",
-            "module",
-            "lineno",
-            "funcName",
-            "created",
-            "msecs",
-            "relativeCreated",
-            "thread",
-            "threadName",
-            "processName",
-            "process",
-            "message",
-            "exc_info",
-            "exc_text",
-            "stack_info",
-        }
-
         for key, value in record.__dict__.items():
-            if key not in excluded_fields:
+            if key not in _RESERVED_RECORD_FIELDS:
                 log_entry[key] = value
 
-        return json.dumps(log_entry, ensure_ascii=False)
+        return _encode_log_entry(log_entry)
 
 
 class AgentContextFilter(logging.Filter):
@@ -100,6 +126,60 @@ class AgentContextFilter(logging.Filter):
         return True
 
 
+class _LocalQueueHandler(QueueHandler):
+    """
+    Queue handler for an in-process listener.
+
+    The message is rendered in the caller so it reflects argument state at
+    the time of the log call; JSON encoding and exception rendering of
+    StructuredFormatter still happen on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge the message arguments, keeping exc_info for the formatter."""
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+# Background listeners started by setup_logging
+_queue_listeners: list[QueueListener] = []
+
+
+def _start_queue_logging(logger_names: tuple[str | None, ...]) -> None:
+    """
+    Move the configured handlers of the given loggers behind queues.
+
+    Loggers sharing the same handler set share one queue and listener, so
+    routing (e.g. error_file only on the root logger) is unchanged.
+    """
+    groups: dict[tuple[logging.Handler, ...], list[logging.Logger]] = {}
+    for name in logger_names:
+        target = logging.getLogger(name)
+        groups.setdefault(tuple(target.handlers), []).append(target)
+
+    for handlers, loggers in groups.items():
+        if not handlers:
+            continue
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        queue_handler = _LocalQueueHandler(log_queue)
+        for target in loggers:
+            target.handlers = [queue_handler]
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _queue_listeners.append(listener)
+
+
+def _stop_queue_logging() -> None:
+    """Flush and stop all background log listeners."""
+    while _queue_listeners:
+        _queue_listeners.pop().stop()
+
+
+atexit.register(_stop_queue_logging)
+
+
 def setup_logging() -> None:
     """
     Configure structured logging for the application.
@@ -180,8 +260,11 @@ def setup_logging() -> None:
         "root": {"level": log_level, "handlers": ["console", "error_file"]},
     }
 
-    # Apply configuration
+    # Apply configuration, then hand formatting and I/O to background
+    # listeners so log calls only enqueue the record
+    _stop_queue_logging()
     logging.config.dictConfig(logging_config)
+    _start_queue_logging((*logging_config["loggers"], None))
 
     # Create module-specific loggers
     app_logger = logging.getLogger("app")
@@ -208,6 +291,13 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(f"app.{name}")
 
 
+# Loggers used by the metric helpers below, resolved once rather than through
+# get_logger (string build plus locked registry lookup) on every event
+_performance_logger = get_logger("performance")
+_interaction_logger = get_logger("interactions")
+_error_logger = get_logger("errors")
+
+
 def log_agent_performance(
     agent_name: str,
     operation: str,
@@ -225,8 +315,10 @@ def log_agent_performance(
         success: Whether the operation was successful
         **kwargs: Additional context
     """
-    logger = get_logger("performance")
-    logger.info(
+    # Skip building the message and extra dict when the level is filtered out
+    if not _performance_logger.isEnabledFor(logging.INFO):
+        return
+    _performance_logger.info(
         f"Agent {agent_name} {operation} {'completed' if success else 'failed'}",
         extra={
             "agent": agent_name,
@@ -254,8 +346,9 @@ def log_user_interaction(
         interaction_type: Type of interaction
         details: Additional interaction details
     """
-    logger = get_logger("interactions")
-    logger.info(
+    if not _interaction_logger.isEnabledFor(logging.INFO):
+        return
+    _interaction_logger.info(
         f"User interaction: {interaction_type}",
         extra={
             "user_id": user_id,
@@ -280,8 +373,9 @@ def log_error(
         context: Additional error context
         agent_name: Name of agent where error occurred
     """
-    logger = get_logger("errors")
-    logger.error(
+    if not _error_logger.isEnabledFor(logging.ERROR):
+        return
+    _error_logger.error(
         f"Error occurred: {error!s}",
         extra={
             "agent": agent_name or "unknown",
@@ -26,6 +26,9 @@ class PropertySearchItem(BaseModel):
         description="Expected return on investment as percentage"
     )
 
+    class Config:
+        frozen = True
+
 
 class PropertySearchResult(BaseModel):
     """Complete property search result with filters applied."""
@@ -47,6 +50,9 @@ class PropertyDetailSpecs(BaseModel):
     has_balcony: bool = Field(description="Whether property has balcony or terrace")
     has_parking: bool = Field(description="Whether parking space is included")
 
+    class Config:
+        frozen = True
+
 
 class PropertyDetailLocation(BaseModel):
     """Detailed property location information."""
@@ -56,6 +62,9 @@ class PropertyDetailLocation(BaseModel):
     address: str = Field(description="Full street address")
     postal_code: str = Field(description="Postal code")
 
+    class Config:
+        frozen = True
+
 
 class PropertyDetailFinancials(BaseModel):
     """Financial details for property investment."""
@@ -67,6 +76,9 @@ class PropertyDetailFinancials(BaseModel):
     )
     management_fee_monthly: int = Field(description="Monthly property management fee")
 
+    class Config:
+        frozen = True
+
 
 class PropertyDetails(BaseModel):
     """Complete detailed property information."""
@@ -78,6 +90,9 @@ class PropertyDetails(BaseModel):
     specs: PropertyDetailSpecs = Field(description="Property specifications")
     financials: PropertyDetailFinancials = Field(description="Financial information")
 
+    class Config:
+        frozen = True
+
 
 class CalculationSummary(BaseModel):
     """Summary of investment calculation inputs and basic outputs."""
@@ -2,14 +2,14 @@
 
 from datetime import datetime
 from decimal import Decimal
-from enum import Enum
+from enum import StrEnum
 from typing import Optional
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
 
-class EnergyClass(str, Enum):
+class EnergyClass(StrEnum):
     """Energy efficiency classes for German properties."""
 
     A_PLUS = "A+"
@@ -19,7 +19,7 @@ class EnergyClass(str, Enum):
     C = "C"
 
 
-class PropertyType(str, Enum):
+class PropertyType(StrEnum):
     """Types of properties available for investment."""
 
     APARTMENT = "apartment"
@@ -39,28 +39,33 @@ class AlertSeverity(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class Metric:
     """Represents a metric measurement."""
 
     name: str
     value: float
     labels: Dict[str, str]
-    timestamp: datetime
+    timestamp: float
     metric_type: MetricType
 
+    @property
+    def timestamp_iso(self) -> str:
+        """Timestamp rendered as an ISO 8601 UTC string."""
+        return datetime.fromtimestamp(self.timestamp, tz=timezone.utc).isoformat()
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert metric to dictionary for serialization."""
         return {
             "name": self.name,
             "value": self.value,
             "labels": self.labels,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp_iso,
             "type": self.metric_type.value,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetric:
     """Performance measurement for agent operations."""
 
@@ -71,10 +76,10 @@ class PerformanceMetric:
     error_type: Optional[str] = None
     user_id: Optional[str] = None
     session_id: Optional[str] = None
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: float = field(default_factory=time.time)
 
 
-@dataclass
+@dataclass(slots=True)
 class UserInteraction:
     """User interaction tracking data."""
 
@@ -86,10 +91,10 @@ class UserInteraction:
     output_tokens: Optional[int] = None
     cost_estimate: Optional[float] = None
     satisfaction_score: Optional[float] = None
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: float = field(default_factory=time.time)
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorEvent:
     """Error event tracking."""
 
@@ -101,7 +106,7 @@ class ErrorEvent:
     user_id: Optional[str] = None
     session_id: Optional[str] = None
     severity: AlertSeverity = AlertSeverity.ERROR
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: float = field(default_factory=time.time)
 
 
 class MetricsCollector:
@@ -131,7 +136,7 @@ class MetricsCollector:
             name=name,
             value=value,
             labels=labels or {},
-            timestamp=datetime.now(timezone.utc),
+            timestamp=time.time(),
             metric_type=metric_type,
         )
 
@@ -263,21 +268,17 @@ class MetricsCollector:
 
     def clear_old_metrics(self, max_age_hours: int = 24) -> None:
         """Clear metrics older than specified hours."""
-        cutoff = datetime.now(timezone.utc).timestamp() - (max_age_hours * 3600)
+        cutoff = time.time() - (max_age_hours * 3600)
 
         with self._lock:
-            self._metrics = [
-                m for m in self._metrics if m.timestamp.timestamp() > cutoff
-            ]
+            self._metrics = [m for m in self._metrics if m.timestamp > cutoff]
             self._performance_metrics = [
-                m for m in self._performance_metrics if m.timestamp.timestamp() > cutoff
+                m for m in self._performance_metrics if m.timestamp > cutoff
             ]
             self._user_interactions = [
-                m for m in self._user_interactions if m.timestamp.timestamp() > cutoff
-            ]
-            self._error_events = [
-                m for m in self._error_events if m.timestamp.timestamp() > cutoff
+                m for m in self._user_interactions if m.timestamp > cutoff
             ]
+            self._error_events = [m for m in self._error_events if m.timestamp > cutoff]
 
 
 class ObservabilityDecorator:
@@ -298,7 +299,7 @@ class ObservabilityDecorator:
 
                 @functools.wraps(func)
                 async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-                    start_time = time.time()
+                    start_ns = time.perf_counter_ns()
                     success = False
                     error_type = None
 
@@ -322,7 +323,7 @@ class ObservabilityDecorator:
                         )
                         raise
                     finally:
-                        duration_ms = (time.time() - start_time) * 1000
+                        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
                         # Record performance
                         self.collector.record_performance(
@@ -340,7 +341,7 @@ class ObservabilityDecorator:
 
                 @functools.wraps(func)
                 def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-                    start_time = time.time()
+                    start_ns = time.perf_counter_ns()
                     success = False
                     error_type = None
 
@@ -364,7 +365,7 @@ class ObservabilityDecorator:
                         )
                         raise
                     finally:
-                        duration_ms = (time.time() - start_time) * 1000
+                        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
                         # Record performance
                         self.collector.record_performance(
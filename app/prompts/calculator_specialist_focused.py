@@ -38,6 +38,7 @@ CALCULATOR_SPECIALIST_FOCUSED_PROMPT = (
 **Tool Usage:**
 - Always use calculation tools for precise results
 - Never estimate or approximate financial figures
+- Use the batch calculation tool when comparing several scenarios
 - Present tool outputs in user-friendly format
 - Include relevant assumptions and disclaimers
 
@@ -5,15 +5,36 @@ Provides specialized tools for property search, knowledge retrieval,
 investment calculations, and external integrations.
 """
 
-from .property_tools import search_properties
-from .knowledge_tools import search_knowledge_base
-from .memory_tools import get_user_preferences, update_user_preferences
-from .conversation_tools import set_conversation_stage
-from .integration_tools import send_email, generate_audio_elevenlabs
-from .legal_tools import search_legal_rag
-from .presentation_tools import search_presentation_rag
-from .chart_tools import create_chart
-from .datetime_tools import get_current_berlin_time
+from importlib import import_module
+from typing import Any, Dict
+
+# Public tool name -> submodule defining it. Tools are imported on first
+# access so that importing one tool module does not load every backend
+# (Vertex AI RAG, conversation analysis, ...) with it.
+_LAZY_TOOLS: Dict[str, str] = {
+    "search_properties": "property_tools",
+    "search_knowledge_base": "knowledge_tools",
+    "get_user_preferences": "memory_tools",
+    "update_user_preferences": "memory_tools",
+    "set_conversation_stage": "conversation_tools",
+    "send_email": "integration_tools",
+    "generate_audio_elevenlabs": "integration_tools",
+    "search_legal_rag": "legal_tools",
+    "search_presentation_rag": "presentation_tools",
+    "create_chart": "chart_tools",
+    "get_current_berlin_time": "datetime_tools",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a tool from its submodule on first access and cache it."""
+    module_name = _LAZY_TOOLS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "search_properties",
@@ -6,12 +6,18 @@ instead of hardcoded keywords for better scalability and context understanding.
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping, Sequence
 
 from google.adk.tools import FunctionTool
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only stand-ins for omitted history / session context; the
+# analysis helpers only read from them
+_NO_HISTORY: Sequence[Dict[str, Any]] = ()
+_EMPTY_SESSION_CONTEXT: Mapping[str, Any] = MappingProxyType({})
+
 
 @FunctionTool
 def analyze_conversation_context(
@@ -35,7 +41,9 @@ def analyze_conversation_context(
     try:
         # Use LLM-based analysis instead of hardcoded patterns
         analysis = _analyze_user_input_with_llm(
-            user_input, conversation_history or [], session_context or {}
+            user_input,
+            conversation_history or _NO_HISTORY,
+            session_context or _EMPTY_SESSION_CONTEXT,
         )
 
         logger.debug(
@@ -50,7 +58,7 @@ def analyze_conversation_context(
         }
 
     except Exception as e:
-        logger.error(f"Error in conversation analysis: {e}")
+        logger.error("Error in conversation analysis: %s", e)
         return {
             "status": "error",
             "message": f"Conversation analysis error: {str(e)}",
@@ -59,7 +67,9 @@ def analyze_conversation_context(
 
 
 def _analyze_user_input_with_llm(
-    user_input: str, conversation_history: list, session_context: dict
+    user_input: str,
+    conversation_history: Sequence[Dict[str, Any]],
+    session_context: Mapping[str, Any],
 ) -> Dict[str, Any]:
     """
     Analyzes user input using structured LLM prompting for intelligent
@@ -95,12 +105,12 @@ def _analyze_user_input_with_llm(
         # For now, return structured analysis based on intelligent heuristics
         return _intelligent_heuristic_analysis(user_input, session_context)
     except Exception as e:
-        logger.error(f"LLM analysis failed: {e}")
+        logger.error("LLM analysis failed: %s", e)
         return _intelligent_heuristic_analysis(user_input, session_context)
 
 
 def _intelligent_heuristic_analysis(
-    user_input: str, session_context: dict
+    user_input: str, session_context: Mapping[str, Any]
 ) -> Dict[str, Any]:
     """
     Intelligent heuristic analysis as fallback when LLM is unavailable.
@@ -147,7 +157,7 @@ def _intelligent_heuristic_analysis(
 
 
 def _determine_interaction_type_intelligent(
-    user_input: str, session_context: dict
+    user_input: str, session_context: Mapping[str, Any]
 ) -> str:
     """
     Determines interaction type using pattern recognition and context.
@@ -460,7 +470,9 @@ def _extract_preferences_intelligent(user_input: str) -> dict:
     return preferences
 
 
-def _determine_conversation_phase(interaction_type: str, session_context: dict) -> str:
+def _determine_conversation_phase(
+    interaction_type: str, session_context: Mapping[str, Any]
+) -> str:
     """Determines the current phase of conversation based on context."""
     if interaction_type == "greeting":
         return "opening"
@@ -483,7 +495,7 @@ def _generate_style_recommendations(
     interaction_type: str,
     emotional_tone: str,
     conversation_phase: str,
-    session_context: dict,
+    session_context: Mapping[str, Any],
 ) -> Dict[str, Any]:
     """Generates style recommendations for the response."""
     recommendations: Dict[str, Any] = {
@@ -575,7 +587,7 @@ def set_conversation_stage(
             }
 
         # Log stage change
-        logger.info(f"Conversation stage set to: {stage}")
+        logger.info("Conversation stage set to: %s", stage)
 
         return {
             "status": "success",
@@ -585,5 +597,5 @@ def set_conversation_stage(
         }
 
     except Exception as e:
-        logger.error(f"Error setting conversation stage: {e}")
+        logger.error("Error setting conversation stage: %s", e)
         return {"status": "error", "message": f"Error setting stage: {str(e)}"}
@@ -5,11 +5,12 @@ Provides integration with third-party services including
 ElevenLabs audio generation.
 """
 
-import os
 import logging
 import asyncio
 from typing import Dict, Any, Optional, AsyncGenerator
 
+from app.config import config
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -40,7 +41,7 @@ def send_email(
         return {"status": "error", "message": "Invalid email address format"}
 
     # Check for email service configuration
-    email_service_endpoint = os.getenv("EMAIL_SERVICE_ENDPOINT")
+    email_service_endpoint = config.external_services.email_service_endpoint
     if not email_service_endpoint:
         logger.warning("Email service not configured, simulating send")
         return {
@@ -89,7 +90,7 @@ def generate_audio_elevenlabs(
     """
     # ElevenLabs API integration
     try:
-        api_key = os.getenv("ELEVENLABS_API_KEY")
+        api_key = config.external_services.elevenlabs_api_key
         if not api_key:
             logger.warning("ElevenLabs API key not configured")
             return {"status": "error", "message": "ElevenLabs API key not configured"}
@@ -113,7 +114,7 @@ def generate_audio_elevenlabs(
         }
 
     except Exception as e:
-        logger.error(f"ElevenLabs generation failed: {str(e)}")
+        logger.error("ElevenLabs generation failed: %s", e)
         return {"status": "error", "message": f"Audio generation failed: {str(e)}"}
 
 
@@ -138,7 +139,7 @@ async def generate_audio_stream_elevenlabs(
     # This would integrate with ElevenLabs streaming API
     # For now, yield empty chunks to maintain interface
 
-    api_key = os.getenv("ELEVENLABS_API_KEY")
+    api_key = config.external_services.elevenlabs_api_key
     if not api_key:
         logger.error("ElevenLabs API key not configured for streaming")
         return
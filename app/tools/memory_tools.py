@@ -45,7 +45,7 @@ def memorize_conversation(
 
         state[const.USER_PREFERENCES][category][key] = value
 
-        logger.info(f"Memorized '{key}' in category '{category}'")
+        logger.info("Memorized '%s' in category '%s'", key, category)
 
         return {
             "status": "success",
@@ -53,7 +53,7 @@ def memorize_conversation(
         }
 
     except Exception as e:
-        logger.error(f"Error memorizing conversation data: {e}")
+        logger.error("Error memorizing conversation data: %s", e)
         return {"status": "error", "message": f"Memory storage error: {str(e)}"}
 
 
@@ -232,7 +232,7 @@ def recall_conversation(
         return {"status": "error", "message": f"Unknown category: {category}"}
 
     except Exception as e:
-        logger.error(f"Error recalling conversation data: {e}")
+        logger.error("Error recalling conversation data: %s", e)
         return {"status": "error", "message": f"Memory retrieval error: {str(e)}"}
 
 
@@ -276,7 +276,7 @@ def _calculate_session_duration(state: Any) -> str:
             return f"{hours}h {minutes}m"
 
     except Exception as e:
-        logger.error(f"Error calculating session duration: {e}")
+        logger.error("Error calculating session duration: %s", e)
         return "calculation error"
 
 
@@ -294,7 +294,7 @@ def initialize_conversation_memory_callback(callback_context: CallbackContext) -
         logger.debug("Conversation memory initialized via callback")
 
     except Exception as e:
-        logger.error(f"Error in memory initialization callback: {e}")
+        logger.error("Error in memory initialization callback: %s", e)
 
 
 @FunctionTool
@@ -341,7 +341,7 @@ def get_user_preferences(
             }
 
     except Exception as e:
-        logger.error(f"Error getting user preferences: {e}")
+        logger.error("Error getting user preferences: %s", e)
         return {"status": "error", "message": f"Error retrieving preferences: {str(e)}"}
 
 
@@ -386,5 +386,5 @@ def update_user_preferences(
         }
 
     except Exception as e:
-        logger.error(f"Error updating user preferences: {e}")
+        logger.error("Error updating user preferences: %s", e)
         return {"status": "error", "message": f"Error updating preferences: {str(e)}"}
@@ -6,12 +6,28 @@ specifically tailored for the German real estate market.
 """
 
 import logging
-import os
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+import math
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypedDict,
+    cast,
+)
 
 from google.adk.tools import FunctionTool
 
+from app.config import config
+
 logger = logging.getLogger(__name__)
 
 # Constants for German real estate market calculations
@@ -30,6 +46,38 @@ REAL_ESTATE_TRANSFER_TAX: Dict[str, float] = {
     "bayern": 3.5,
     "default": 5.0,
 }
+# Approximate market data (should be replaced with real-time data)
+AVERAGE_PRICE_PER_SQM: Dict[str, float] = {
+    "münchen": 9500,
+    "munich": 9500,
+    "frankfurt": 6500,
+    "hamburg": 6000,
+    "berlin": 5500,
+    "stuttgart": 5200,
+    "düsseldorf": 5000,
+    "cologne": 4800,
+    "köln": 4800,
+    "leipzig": 3200,
+    "dresden": 3500,
+}
+DEFAULT_AVERAGE_PRICE_PER_SQM: float = 4500
+
+# Percentage constants above as ratios, resolved once at import
+_MAINTENANCE_RATE: float = DEFAULT_MAINTENANCE_COST_PERCENTAGE / 100
+_MANAGEMENT_RATE: float = DEFAULT_MANAGEMENT_FEE_PERCENTAGE / 100
+_APPRECIATION_RATE: float = DEFAULT_PROPERTY_APPRECIATION_RATE / 100
+# Lookup tables keyed by case-folded names: (transfer tax percent, combined
+# transfer tax plus notary fee ratio) per region, and city prices
+_ACQUISITION_RATES_BY_REGION: Dict[str, Tuple[float, float]] = {
+    region.casefold(): (rate, (rate + NOTARY_AND_REGISTRATION_FEE) / 100)
+    for region, rate in REAL_ESTATE_TRANSFER_TAX.items()
+}
+_DEFAULT_ACQUISITION_RATES: Tuple[float, float] = _ACQUISITION_RATES_BY_REGION[
+    "default"
+]
+_CITY_PRICES_CF: Dict[str, float] = {
+    city.casefold(): price for city, price in AVERAGE_PRICE_PER_SQM.items()
+}
 
 # Error messages for validation
 ERROR_INVALID_LOCATION = "Invalid location parameter provided"
@@ -39,6 +87,290 @@ ERROR_INVALID_PRICE_RANGE = (
 ERROR_INVALID_SIZE_RANGE = "Invalid size range format. Use format: min_size-max_size"
 ERROR_API_UNAVAILABLE = "Property search API is currently unavailable"
 ERROR_CALCULATION_FAILED = "Investment calculation failed due to invalid parameters"
+# Messages for the optional min_price, max_price, min_size, max_size filters,
+# in that order
+_RANGE_FILTER_ERRORS: Tuple[str, ...] = (
+    "Minimum price must be a positive integer",
+    "Maximum price must be a positive integer",
+    "Minimum size must be a positive integer",
+    "Maximum size must be a positive integer",
+)
+
+# Upper bound for scenarios accepted by calculate_investment_return_batch
+MAX_BATCH_SCENARIOS: int = 100
+# Money and percentage fields of a batch scenario; fractional values are valid
+_AMOUNT_SCENARIO_FIELDS: Tuple[str, ...] = (
+    "purchase_price",
+    "monthly_rent",
+    "annual_expenses",
+    "financing_percentage",
+    "interest_rate_percent",
+)
+
+# Static responses for the unconfigured / not-yet-implemented paths.
+# Read-only templates; tools return a shallow dict copy because ADK
+# expects a plain ``dict`` as the function response.
+_NOT_IMPLEMENTED_SEARCH: Mapping[str, Any] = MappingProxyType(
+    {
+        "status": "not_implemented",
+        "message": "Property search functionality is not yet implemented.",
+        "properties": (),
+        "total_found": 0,
+    }
+)
+_NOT_IMPLEMENTED_DETAILS: Mapping[str, Any] = MappingProxyType(
+    {
+        "status": "not_implemented",
+        "message": "Property details functionality is not yet implemented.",
+    }
+)
+_NO_API_KEY_ERROR: Mapping[str, Any] = MappingProxyType(
+    {
+        "status": "error",
+        "message": "Property API not configured",
+    }
+)
+# Static part of the demo listings; id, title, location and property type are
+# filled in per search by _get_demo_properties
+_DEMO_LISTINGS: Tuple[Mapping[str, Any], ...] = (
+    MappingProxyType(
+        {
+            "price": 450000,
+            "size_sqm": 75,
+            "rooms": 3,
+            "year_built": 2020,
+            "energy_efficiency": "A+",
+            "features": ("Balcony", "Elevator", "Underground Parking", "Floor Heating"),
+            "investment_metrics": MappingProxyType(
+                {
+                    "price_per_sqm": 6000,
+                    "gross_yield": "3.2%",
+                    "estimated_rent": 1200,
+                }
+            ),
+        }
+    ),
+    MappingProxyType(
+        {
+            "price": 380000,
+            "size_sqm": 85,
+            "rooms": 3.5,
+            "year_built": 1995,
+            "energy_efficiency": "C",
+            "features": ("Garden", "Renovated 2022", "Storage Room", "Bike Room"),
+            "investment_metrics": MappingProxyType(
+                {
+                    "price_per_sqm": 4471,
+                    "gross_yield": "3.6%",
+                    "estimated_rent": 1140,
+                }
+            ),
+        }
+    ),
+)
+_DEMO_SEARCH_MESSAGE = (
+    "Using demo data. Configure PROPERTY_SEARCH_API_KEY for real searches."
+)
+
+
+# Amount fields are annotated ``float`` but also carry ints: the single tool
+# passes its int inputs through and the no-financing branch reports int zeros
+class InvestmentSummary(TypedDict):
+    """Purchase and capital structure section of an investment result."""
+
+    purchase_price: float
+    acquisition_costs: float
+    total_investment: float
+    equity_required: float
+    loan_amount: float
+    location: str
+
+
+class IncomeAnalysis(TypedDict):
+    """Rental income section of an investment result."""
+
+    monthly_rent: float
+    annual_rent: float
+    annual_expenses: float
+    net_annual_income: float
+
+
+class FinancingDetails(TypedDict):
+    """Loan and debt service section of an investment result."""
+
+    financing_percentage: float
+    interest_rate: float
+    annual_interest: float
+    annual_principal: float
+    annual_debt_service: float
+
+
+class YieldMetrics(TypedDict):
+    """Yield section of an investment result."""
+
+    gross_yield_percent: float
+    net_yield_percent: float
+    cash_on_cash_return_percent: float
+    annual_cash_flow: float
+
+
+class TaxBenefits(TypedDict):
+    """German tax benefit section of an investment result."""
+
+    annual_depreciation_afa: float
+    tax_deductible_expenses: float
+    transfer_tax_rate: float
+
+
+class ReturnProjections(TypedDict):
+    """Holding period projection section of an investment result."""
+
+    investment_period_years: int
+    future_property_value: float
+    total_rental_income: float
+    capital_gain: float
+    loan_paydown: float
+    total_return: float
+    annualized_return_percent: float
+
+
+class InvestmentAssumptions(TypedDict):
+    """Market assumptions used by the investment calculation."""
+
+    appreciation_rate_percent: float
+    maintenance_cost_percent: float
+    management_fee_percent: float
+
+
+class InvestmentResult(TypedDict):
+    """Successful calculate_investment_return response."""
+
+    status: str
+    investment_summary: InvestmentSummary
+    income_analysis: IncomeAnalysis
+    financing_details: FinancingDetails
+    yield_metrics: YieldMetrics
+    tax_benefits: TaxBenefits
+    projections: ReturnProjections
+    assumptions: InvestmentAssumptions
+
+
+# Layout of the calculate_investment_return response, derived from the
+# section TypedDicts. Values are passed to _build_investment_response as one
+# flat sequence in this exact order.
+_RESPONSE_SECTIONS: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(
+    (section, tuple(schema.__annotations__))
+    for section, schema in (
+        ("investment_summary", InvestmentSummary),
+        ("income_analysis", IncomeAnalysis),
+        ("financing_details", FinancingDetails),
+        ("yield_metrics", YieldMetrics),
+        ("tax_benefits", TaxBenefits),
+        ("projections", ReturnProjections),
+    )
+)
+_RESPONSE_OFFSETS: Tuple[int, ...] = tuple(
+    accumulate((len(fields) for _, fields in _RESPONSE_SECTIONS[:-1]), initial=0)
+)
+# Inputs, rates and ratios reported as given; every other float is an amount
+# or percentage rounded to cents
+_UNROUNDED_RESPONSE_FIELDS = frozenset(
+    {
+        "location",
+        "financing_percentage",
+        "interest_rate",
+        "transfer_tax_rate",
+        "investment_period_years",
+    }
+)
+# Per-position flag over the flat value sequence: True where cents rounding applies
+_ROUNDED_POSITIONS: Tuple[bool, ...] = tuple(
+    field_name not in _UNROUNDED_RESPONSE_FIELDS
+    for _, fields in _RESPONSE_SECTIONS
+    for field_name in fields
+)
+_ASSUMPTIONS: Mapping[str, float] = MappingProxyType(
+    {
+        "appreciation_rate_percent": DEFAULT_PROPERTY_APPRECIATION_RATE,
+        "maintenance_cost_percent": DEFAULT_MAINTENANCE_COST_PERCENTAGE,
+        "management_fee_percent": DEFAULT_MANAGEMENT_FEE_PERCENTAGE,
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class InvestmentInputs:
+    """Validated inputs for an investment return calculation."""
+
+    purchase_price: float
+    monthly_rent: float
+    annual_expenses: Optional[float] = None
+    financing_percentage: float = 0
+    interest_rate_percent: float = 4
+    investment_period_years: int = 10
+    location: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        """Validate input parameters."""
+        # NaN compares False against every bound below, so check it first
+        for value in (
+            self.purchase_price,
+            self.monthly_rent,
+            self.annual_expenses,
+            self.financing_percentage,
+            self.interest_rate_percent,
+        ):
+            if value is not None and not math.isfinite(value):
+                raise ValueError("Amounts and rates must be finite numbers")
+        if self.purchase_price <= 0:
+            raise ValueError("Purchase price must be greater than 0")
+        if self.monthly_rent <= 0:
+            raise ValueError("Monthly rent must be greater than 0")
+        if self.financing_percentage < 0 or self.financing_percentage > 100:
+            raise ValueError("Financing percentage must be between 0 and 100")
+        if self.interest_rate_percent < 0:
+            raise ValueError("Interest rate must be greater than or equal to 0")
+        if self.investment_period_years <= 0:
+            raise ValueError("Investment period must be greater than 0")
+
+    @classmethod
+    def from_scenario(cls, scenario: Dict[str, Any]) -> "InvestmentInputs":
+        """
+        Build inputs from an untyped batch scenario.
+
+        Batch scenarios arrive as JSON objects, so values may come in as
+        numeric strings. Amounts and percentages are coerced to built-in
+        numbers without truncation; the holding period must be a whole
+        number of years.
+
+        Args:
+            scenario: Dictionary of calculate_investment_return parameters
+
+        Returns:
+            Validated investment inputs
+
+        Raises:
+            ValueError: If the scenario is malformed or values are out of range
+        """
+        if not isinstance(scenario, dict):
+            raise ValueError("Scenario must be a dictionary of calculation parameters")
+
+        normalized = dict(scenario)
+        for field_name in (*_AMOUNT_SCENARIO_FIELDS, "investment_period_years"):
+            if type(normalized.get(field_name)) is bool:
+                raise ValueError(f"{field_name} must be a number, not a boolean")
+        for field_name in _AMOUNT_SCENARIO_FIELDS:
+            value = normalized.get(field_name)
+            if value is not None and type(value) not in (int, float):
+                normalized[field_name] = float(value)
+
+        period = normalized.get("investment_period_years")
+        if period is not None and type(period) is not int:
+            years = float(period)
+            if not years.is_integer():
+                raise ValueError("Investment period must be a whole number of years")
+            normalized["investment_period_years"] = int(years)
+        return cls(**normalized)
 
 
 @FunctionTool
@@ -77,37 +409,38 @@ def search_properties(
         if not location or not isinstance(location, str):
             raise ValueError(ERROR_INVALID_LOCATION)
 
-        # Validate price range parameters
-        if min_price is not None and (not isinstance(min_price, int) or min_price < 0):
-            raise ValueError("Minimum price must be a positive integer")
-        if max_price is not None and (not isinstance(max_price, int) or max_price < 0):
-            raise ValueError("Maximum price must be a positive integer")
+        # Validate price and size range parameters
+        for value, message in zip(
+            (min_price, max_price, min_size, max_size), _RANGE_FILTER_ERRORS
+        ):
+            if value is not None and (type(value) is not int or value < 0):
+                raise ValueError(message)
         if min_price is not None and max_price is not None and min_price > max_price:
             raise ValueError("Minimum price cannot be greater than maximum price")
-
-        # Validate size range parameters
-        if min_size is not None and (not isinstance(min_size, int) or min_size < 0):
-            raise ValueError("Minimum size must be a positive integer")
-        if max_size is not None and (not isinstance(max_size, int) or max_size < 0):
-            raise ValueError("Maximum size must be a positive integer")
         if min_size is not None and max_size is not None and min_size > max_size:
             raise ValueError("Minimum size cannot be greater than maximum size")
 
         # Log search parameters
         logger.info(
-            f"Searching properties in {location} with filters: "
-            f"type={property_type}, price={min_price}-{max_price}, size={min_size}-{max_size}"
+            "Searching properties in %s with filters: "
+            "type=%s, price=%s-%s, size=%s-%s",
+            location,
+            property_type,
+            min_price,
+            max_price,
+            min_size,
+            max_size,
         )
 
         # Check if property search API is configured
-        property_api_key = os.getenv("PROPERTY_SEARCH_API_KEY")
+        property_api_key = config.external_services.property_search_api_key
         if not property_api_key:
             logger.warning("Property search API not configured, returning sample data")
 
             # Return realistic sample properties for demo purposes
             return {
                 "status": "demo",
-                "message": "Using demo data. Configure PROPERTY_SEARCH_API_KEY for real searches.",
+                "message": _DEMO_SEARCH_MESSAGE,
                 "search_criteria": {
                     "location": location,
                     "property_type": property_type,
@@ -118,12 +451,7 @@ def search_properties(
                 },
                 "properties": _get_demo_properties(location, property_type),
                 "total_found": 2,
-                "market_summary": {
-                    "average_price_per_sqm": _get_average_price_per_sqm(location),
-                    "average_yield": "3.2%",
-                    "market_trend": "stable",
-                    "demand_level": "high",
-                },
+                "market_summary": dict(_market_summary(location)),
             }
 
         # TODO: Implement actual property search API integration
@@ -140,15 +468,11 @@ def search_properties(
         #     limit=max_results
         # )
 
-        return {
-            "status": "not_implemented",
-            "message": "Property search functionality is not yet implemented.",
-            "properties": [],
-            "total_found": 0,
-        }
+        # Fresh list so "properties" has the same type on every search path
+        return {**_NOT_IMPLEMENTED_SEARCH, "properties": []}
 
     except Exception as e:
-        logger.error(f"Property search failed: {str(e)}")
+        logger.error("Property search failed: %s", e)
         return {
             "status": "error",
             "message": f"Unable to search properties: {str(e)}",
@@ -175,31 +499,22 @@ def get_property_details(
         Detailed property information with investment analysis
     """
     try:
-        logger.info(f"Fetching details for property: {property_id}")
+        logger.info("Fetching details for property: %s", property_id)
 
         # Check if property API is configured
-        property_api_key = os.getenv("PROPERTY_SEARCH_API_KEY")
+        property_api_key = config.external_services.property_search_api_key
         if not property_api_key:
-            return {
-                "status": "error",
-                "message": "Property API not configured",
-                "property_id": property_id,
-            }
+            return {**_NO_API_KEY_ERROR, "property_id": property_id}
 
         # TODO: Implement actual property details API call
         # from app.services.property_api import PropertySearchClient
         # client = PropertySearchClient(api_key=property_api_key)
         # details = client.get_property(property_id)
 
-        return {
-            "status": "not_implemented",
-            "message": "Property details functionality is not yet implemented.",
-            "property_id": property_id,
-            "details": {},
-        }
+        return {**_NOT_IMPLEMENTED_DETAILS, "property_id": property_id, "details": {}}
 
     except Exception as e:
-        logger.error(f"Failed to get property details: {str(e)}")
+        logger.error("Failed to get property details: %s", e)
         return {
             "status": "error",
             "message": f"Unable to retrieve property details: {str(e)}",
@@ -242,227 +557,420 @@ def calculate_investment_return(
         ValueError: If input parameters are invalid or out of range
     """
     try:
-        # Validate input parameters
-        if purchase_price <= 0:
-            raise ValueError("Purchase price must be greater than 0")
-        if monthly_rent <= 0:
-            raise ValueError("Monthly rent must be greater than 0")
-        if financing_percentage < 0 or financing_percentage > 100:
-            raise ValueError("Financing percentage must be between 0 and 100")
-        if interest_rate_percent < 0:
-            raise ValueError("Interest rate must be greater than or equal to 0")
-        if investment_period_years <= 0:
-            raise ValueError("Investment period must be greater than 0")
-
-        # Convert percentage to decimal for calculations
-        interest_rate = interest_rate_percent / 100.0
-        # financing_ratio = financing_percentage / 100.0  # Commented out as not used
-
-        logger.info(
-            f"Calculating investment returns for €{purchase_price:,} property, "
-            f"rent: €{monthly_rent}/month"
-        )
-
-        # Calculate acquisition costs (German specific)
-        transfer_tax_rate = REAL_ESTATE_TRANSFER_TAX.get(
-            location.lower() if location else "default",
-            REAL_ESTATE_TRANSFER_TAX["default"],
-        )
-        acquisition_costs = purchase_price * (
-            (transfer_tax_rate + NOTARY_AND_REGISTRATION_FEE) / 100
+        inputs = InvestmentInputs(
+            purchase_price,
+            monthly_rent,
+            annual_expenses,
+            financing_percentage,
+            interest_rate_percent,
+            investment_period_years,
+            location,
         )
-        total_investment = purchase_price + acquisition_costs
+        # Thousands separators need str.format, so only build them when logged
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Calculating investment returns for €%s property, rent: €%s/month",
+                f"{purchase_price:,}",
+                monthly_rent,
+            )
 
-        # Annual income calculations
-        annual_rent = monthly_rent * 12
+        return cast(Dict[str, Any], _calculate_investment(inputs))
 
-        # Estimate annual expenses if not provided
-        if annual_expenses is None:
-            maintenance = purchase_price * (DEFAULT_MAINTENANCE_COST_PERCENTAGE / 100)
-            management = annual_rent * (DEFAULT_MANAGEMENT_FEE_PERCENTAGE / 100)
-            annual_expenses_value: float = maintenance + management
-            logger.debug(f"Estimated annual expenses: €{annual_expenses_value:,.0f}")
-        else:
-            annual_expenses_value = float(annual_expenses)
-
-        net_annual_income = annual_rent - annual_expenses_value
-
-        # Financing calculations
-        if financing_percentage > 0:
-            loan_amount = purchase_price * (financing_percentage / 100)
-            equity_required = total_investment - loan_amount
-            annual_interest = loan_amount * (interest_rate / 100)
+    except Exception as e:
+        logger.error("Investment calculation failed: %s", e)
+        return {
+            "status": "error",
+            "message": f"Unable to calculate investment returns: {str(e)}",
+        }
 
-            # Simplified loan amortization (1% annual)
-            annual_principal = loan_amount * 0.01
-            annual_debt_service = annual_interest + annual_principal
 
-            net_cash_flow = net_annual_income - annual_debt_service
-        else:
-            loan_amount = 0
-            equity_required = total_investment
-            annual_interest = 0
-            annual_principal = 0
-            annual_debt_service = 0
-            net_cash_flow = net_annual_income
-
-        # German tax benefits calculation
-        annual_depreciation = purchase_price * 0.02  # 2% AfA for residential
-        tax_deductible_expenses = (
-            annual_expenses_value + annual_interest + annual_depreciation
-        )
+@FunctionTool
+def calculate_investment_return_batch(
+    scenarios: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Calculate investment returns for several scenarios in one call.
 
-        # Yield calculations
-        gross_yield = (annual_rent / total_investment) * 100
-        net_yield = (net_annual_income / total_investment) * 100
-        cash_on_cash_return = (
-            (net_cash_flow / equity_required) * 100 if equity_required > 0 else 0
-        )
+    Lets investors compare variations of a deal (price, financing share,
+    interest rate, holding period) without one tool call per scenario.
+    A failing scenario does not abort the batch; its entry carries an
+    error status instead.
 
-        # Property value projection
-        appreciation_rate = DEFAULT_PROPERTY_APPRECIATION_RATE / 100
-        future_property_value = purchase_price * (
-            (1 + appreciation_rate) ** (investment_period_years or 0)
-        )
+    Args:
+        scenarios: List of scenarios, each a dictionary with the parameters of
+            calculate_investment_return (purchase_price, monthly_rent,
+            annual_expenses, financing_percentage, interest_rate_percent,
+            investment_period_years, location)
 
-        # Total return calculation
-        total_rental_income = net_cash_flow * (investment_period_years or 0)
-        capital_gain = future_property_value - purchase_price
-        loan_paydown = (
-            annual_principal * (investment_period_years or 0)
-            if financing_percentage > 0
-            else 0
-        )
-        total_return = total_rental_income + capital_gain + loan_paydown
-
-        # Annualized return
-        if equity_required > 0 and investment_period_years:
-            total_return_rate = (
-                (total_return + equity_required) / equity_required
-            ) ** (1 / investment_period_years) - 1
-            annualized_return = total_return_rate * 100
-        else:
-            annualized_return = 0
+    Returns:
+        Dictionary with one investment analysis per scenario, in input order
+    """
+    try:
+        if not scenarios or not isinstance(scenarios, list):
+            raise ValueError("At least one scenario must be provided")
+        if len(scenarios) > MAX_BATCH_SCENARIOS:
+            raise ValueError(
+                f"At most {MAX_BATCH_SCENARIOS} scenarios can be calculated at once"
+            )
+
+        logger.info("Calculating investment returns for %d scenarios", len(scenarios))
+
+        results: List[Dict[str, Any]] = []
+        for index, scenario in enumerate(scenarios):
+            result: Dict[str, Any]
+            try:
+                result = cast(
+                    Dict[str, Any],
+                    _calculate_investment(InvestmentInputs.from_scenario(scenario)),
+                )
+            except Exception as e:
+                logger.warning("Scenario %d calculation failed: %s", index, e)
+                result = {
+                    "status": "error",
+                    "message": f"Unable to calculate investment returns: {str(e)}",
+                }
+            result["scenario_index"] = index
+            results.append(result)
 
         return {
             "status": "success",
-            "investment_summary": {
-                "purchase_price": round(purchase_price, 2),
-                "acquisition_costs": round(acquisition_costs, 2),
-                "total_investment": round(total_investment, 2),
-                "equity_required": round(equity_required, 2),
-                "loan_amount": round(loan_amount, 2),
-                "location": location or "Germany",
-            },
-            "income_analysis": {
-                "monthly_rent": round(monthly_rent, 2),
-                "annual_rent": round(annual_rent, 2),
-                "annual_expenses": round(annual_expenses_value, 2),
-                "net_annual_income": round(net_annual_income, 2),
-            },
-            "financing_details": {
-                "financing_percentage": financing_percentage,
-                "interest_rate": interest_rate,
-                "annual_interest": round(annual_interest, 2),
-                "annual_principal": round(annual_principal, 2),
-                "annual_debt_service": round(annual_debt_service, 2),
-            },
-            "yield_metrics": {
-                "gross_yield_percent": round(gross_yield, 2),
-                "net_yield_percent": round(net_yield, 2),
-                "cash_on_cash_return_percent": round(cash_on_cash_return, 2),
-                "annual_cash_flow": round(net_cash_flow, 2),
-            },
-            "tax_benefits": {
-                "annual_depreciation_afa": round(annual_depreciation, 2),
-                "tax_deductible_expenses": round(tax_deductible_expenses, 2),
-                "transfer_tax_rate": transfer_tax_rate,
-            },
-            "projections": {
-                "investment_period_years": investment_period_years,
-                "future_property_value": round(future_property_value, 2),
-                "total_rental_income": round(total_rental_income, 2),
-                "capital_gain": round(capital_gain, 2),
-                "loan_paydown": round(loan_paydown, 2),
-                "total_return": round(total_return, 2),
-                "annualized_return_percent": round(annualized_return, 2),
-            },
-            "assumptions": {
-                "appreciation_rate_percent": DEFAULT_PROPERTY_APPRECIATION_RATE,
-                "maintenance_cost_percent": DEFAULT_MAINTENANCE_COST_PERCENTAGE,
-                "management_fee_percent": DEFAULT_MANAGEMENT_FEE_PERCENTAGE,
-            },
+            "scenario_count": len(results),
+            "results": results,
         }
 
     except Exception as e:
-        logger.error(f"Investment calculation failed: {str(e)}")
+        logger.error("Batch investment calculation failed: %s", e)
         return {
             "status": "error",
-            "message": f"Unable to calculate investment returns: {str(e)}",
+            "message": f"Unable to calculate investment scenarios: {str(e)}",
         }
 
 
+class InvestmentFigures(NamedTuple):
+    """Raw (unrounded) figures produced by the investment kernel."""
+
+    acquisition_costs: float
+    total_investment: float
+    equity_required: float
+    loan_amount: float
+    annual_rent: float
+    annual_expenses: float
+    net_annual_income: float
+    annual_interest: float
+    annual_principal: float
+    annual_debt_service: float
+    gross_yield: float
+    net_yield: float
+    cash_on_cash_return: float
+    net_cash_flow: float
+    annual_depreciation: float
+    tax_deductible_expenses: float
+    future_property_value: float
+    total_rental_income: float
+    capital_gain: float
+    loan_paydown: float
+    total_return: float
+    annualized_return: float
+
+
+def _calculate_investment(inputs: InvestmentInputs) -> InvestmentResult:
+    """
+    Run the investment calculation shared by the single and batch tools.
+
+    Callers log the request themselves so a batch logs once rather than
+    once per scenario.
+    """
+    purchase_price = inputs.purchase_price
+    monthly_rent = inputs.monthly_rent
+
+    # Convert percentage to decimal for calculations
+    interest_rate = inputs.interest_rate_percent / 100.0
+
+    # Calculate acquisition costs (German specific)
+    transfer_tax_rate, acquisition_rate = _acquisition_rates_for(inputs.location)
+
+    figures = _compute_investment_metrics(
+        purchase_price,
+        monthly_rent,
+        inputs.annual_expenses,
+        inputs.financing_percentage / 100,
+        interest_rate,
+        inputs.investment_period_years,
+        acquisition_rate,
+    )
+    if inputs.annual_expenses is None and logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Estimated annual expenses: €%s", f"{figures.annual_expenses:,.0f}"
+        )
+
+    return _build_investment_response(
+        purchase_price,
+        figures.acquisition_costs,
+        figures.total_investment,
+        figures.equity_required,
+        figures.loan_amount,
+        inputs.location or "Germany",
+        monthly_rent,
+        figures.annual_rent,
+        figures.annual_expenses,
+        figures.net_annual_income,
+        inputs.financing_percentage,
+        interest_rate,
+        figures.annual_interest,
+        figures.annual_principal,
+        figures.annual_debt_service,
+        figures.gross_yield,
+        figures.net_yield,
+        figures.cash_on_cash_return,
+        figures.net_cash_flow,
+        figures.annual_depreciation,
+        figures.tax_deductible_expenses,
+        transfer_tax_rate,
+        inputs.investment_period_years,
+        figures.future_property_value,
+        figures.total_rental_income,
+        figures.capital_gain,
+        figures.loan_paydown,
+        figures.total_return,
+        figures.annualized_return,
+    )
+
+
+# typed=True keeps int and float inputs apart so cached figures keep the
+# numeric types a fresh computation would produce
+@lru_cache(maxsize=256, typed=True)
+def _compute_investment_metrics(
+    purchase_price: float,
+    monthly_rent: float,
+    annual_expenses: Optional[float],
+    financing_ratio: float,
+    interest_rate: float,
+    investment_period_years: int,
+    acquisition_rate: float,
+) -> InvestmentFigures:
+    """
+    Pure numeric core of the investment calculation.
+
+    Takes already validated scalars and pre-resolved rates, performs no
+    lookups, logging or allocation beyond the result tuple. Being pure, it is
+    memoized so repeated identical scenarios skip the arithmetic.
+
+    Args:
+        purchase_price: Property acquisition price in EUR
+        monthly_rent: Monthly rental income in EUR
+        annual_expenses: Annual operating expenses, or None to estimate them
+        financing_ratio: Financed share of the purchase price (0-1)
+        interest_rate: Annual loan interest rate as a ratio
+        investment_period_years: Holding period in years
+        acquisition_rate: Transfer tax plus notary fee as a ratio of the price
+
+    Returns:
+        Unrounded investment figures
+    """
+    acquisition_costs = purchase_price * acquisition_rate
+    total_investment = purchase_price + acquisition_costs
+
+    # Annual income calculations
+    annual_rent = monthly_rent * 12
+
+    # Estimate annual expenses if not provided
+    if annual_expenses is None:
+        maintenance = purchase_price * _MAINTENANCE_RATE
+        management = annual_rent * _MANAGEMENT_RATE
+        annual_expenses_value: float = maintenance + management
+    else:
+        annual_expenses_value = float(annual_expenses)
+
+    net_annual_income = annual_rent - annual_expenses_value
+
+    # Financing calculations
+    if financing_ratio > 0:
+        loan_amount = purchase_price * financing_ratio
+        equity_required = total_investment - loan_amount
+        annual_interest = loan_amount * (interest_rate / 100)
+
+        # Simplified loan amortization (1% annual)
+        annual_principal = loan_amount * 0.01
+        annual_debt_service = annual_interest + annual_principal
+
+        net_cash_flow = net_annual_income - annual_debt_service
+    else:
+        loan_amount = 0
+        equity_required = total_investment
+        annual_interest = 0
+        annual_principal = 0
+        annual_debt_service = 0
+        net_cash_flow = net_annual_income
+
+    # German tax benefits calculation
+    annual_depreciation = purchase_price * 0.02  # 2% AfA for residential
+    tax_deductible_expenses = (
+        annual_expenses_value + annual_interest + annual_depreciation
+    )
+
+    # Yield calculations
+    gross_yield = (annual_rent / total_investment) * 100
+    net_yield = (net_annual_income / total_investment) * 100
+    cash_on_cash_return = (
+        (net_cash_flow / equity_required) * 100 if equity_required > 0 else 0
+    )
+
+    # Property value projection
+    future_property_value = purchase_price * math.pow(
+        1 + _APPRECIATION_RATE, investment_period_years
+    )
+
+    # Total return calculation
+    total_rental_income = net_cash_flow * investment_period_years
+    capital_gain = future_property_value - purchase_price
+    loan_paydown = annual_principal * investment_period_years
+    total_return = total_rental_income + capital_gain + loan_paydown
+
+    # Annualized return: (final / initial) ** (1 / years) - 1, via expm1/log
+    # for precision at small rates
+    if equity_required > 0:
+        growth_ratio = (total_return + equity_required) / equity_required
+        if growth_ratio > 0:
+            annualized_return = (
+                math.expm1(math.log(growth_ratio) / investment_period_years) * 100
+            )
+        elif investment_period_years == 1:
+            # A one-year root is the ratio itself, so the loss stays real
+            annualized_return = (growth_ratio - 1) * 100
+        else:
+            # Losses exceed the equity invested; the root has no real value
+            annualized_return = -100.0
+    else:
+        annualized_return = 0
+
+    return InvestmentFigures(
+        acquisition_costs,
+        total_investment,
+        equity_required,
+        loan_amount,
+        annual_rent,
+        annual_expenses_value,
+        net_annual_income,
+        annual_interest,
+        annual_principal,
+        annual_debt_service,
+        gross_yield,
+        net_yield,
+        cash_on_cash_return,
+        net_cash_flow,
+        annual_depreciation,
+        tax_deductible_expenses,
+        future_property_value,
+        total_rental_income,
+        capital_gain,
+        loan_paydown,
+        total_return,
+        annualized_return,
+    )
+
+
+def _round_amounts(*values: Any) -> List[Any]:
+    """Round monetary amounts and percentages to cents in a single pass."""
+    # float() also unwraps float subclasses (e.g. numpy.float64) so the
+    # response only ever holds built-in JSON-native numbers
+    return [
+        round(float(value), 2) if rounded and isinstance(value, float) else value
+        for value, rounded in zip(values, _ROUNDED_POSITIONS)
+    ]
+
+
+def _build_investment_response(*values: Any) -> InvestmentResult:
+    """
+    Assemble the investment response from values in ``_RESPONSE_SECTIONS`` order.
+
+    Args:
+        *values: Flat sequence of result values matching the section schema
+
+    Returns:
+        Nested response dictionary with rounded amounts
+    """
+    rounded = _round_amounts(*values)
+    response: Dict[str, Any] = {"status": "success"}
+    for (section, fields), offset in zip(_RESPONSE_SECTIONS, _RESPONSE_OFFSETS):
+        response[section] = dict(zip(fields, rounded[offset : offset + len(fields)]))
+    response["assumptions"] = dict(_ASSUMPTIONS)
+    return cast(InvestmentResult, response)
+
+
 def _get_demo_properties(location: str, property_type: str) -> List[Dict[str, Any]]:
     """Generate realistic demo properties for testing."""
-    base_properties = [
+    title_1, location_1, title_2, location_2 = _demo_titles(location, property_type)
+    # One clock read per search; the suffix keeps the ids distinct
+    id_prefix = f"demo_{time.time():.0f}"
+    return [
         {
-            "id": f"demo_{datetime.now().timestamp():.0f}_1",
-            "title": f"Modern {property_type.title()} in Prime Location",
-            "location": f"{location} - City Center",
+            "id": f"{id_prefix}_{number}",
+            "title": title,
+            "location": listing_location,
             "property_type": property_type,
-            "price": 450000,
-            "size_sqm": 75,
-            "rooms": 3,
-            "year_built": 2020,
-            "energy_efficiency": "A+",
-            "features": ["Balcony", "Elevator", "Underground Parking", "Floor Heating"],
-            "investment_metrics": {
-                "price_per_sqm": 6000,
-                "gross_yield": "3.2%",
-                "estimated_rent": 1200,
-            },
-        },
-        {
-            "id": f"demo_{datetime.now().timestamp():.0f}_2",
-            "title": f"Renovated {property_type.title()} with Garden Access",
-            "location": f"{location} - Residential Area",
-            "property_type": property_type,
-            "price": 380000,
-            "size_sqm": 85,
-            "rooms": 3.5,
-            "year_built": 1995,
-            "energy_efficiency": "C",
-            "features": ["Garden", "Renovated 2022", "Storage Room", "Bike Room"],
-            "investment_metrics": {
-                "price_per_sqm": 4471,
-                "gross_yield": "3.6%",
-                "estimated_rent": 1140,
-            },
-        },
+            **listing,
+            # Fresh containers so callers never share the frozen template
+            "features": list(listing["features"]),
+            "investment_metrics": dict(listing["investment_metrics"]),
+        }
+        for number, title, listing_location, listing in (
+            (1, title_1, location_1, _DEMO_LISTINGS[0]),
+            (2, title_2, location_2, _DEMO_LISTINGS[1]),
+        )
     ]
 
-    return base_properties
+
+@lru_cache(maxsize=128)
+def _demo_titles(location: str, property_type: str) -> Tuple[str, str, str, str]:
+    """Build the demo listing titles and locations for a search."""
+    type_title = property_type.title()
+    return (
+        f"Modern {type_title} in Prime Location",
+        f"{location} - City Center",
+        f"Renovated {type_title} with Garden Access",
+        f"{location} - Residential Area",
+    )
 
 
+@lru_cache(maxsize=128)
+def _market_summary(location: str) -> Mapping[str, Any]:
+    """Build the read-only demo market summary for a location."""
+    return MappingProxyType(
+        {
+            "average_price_per_sqm": _get_average_price_per_sqm(location),
+            "average_yield": "3.2%",
+            "market_trend": "stable",
+            "demand_level": "high",
+        }
+    )
+
+
+@lru_cache(maxsize=256)
 def _get_average_price_per_sqm(location: str) -> float:
     """Get average price per square meter for major German cities."""
-    # Approximate market data (should be replaced with real-time data)
-    city_prices = {
-        "münchen": 9500,
-        "munich": 9500,
-        "frankfurt": 6500,
-        "hamburg": 6000,
-        "berlin": 5500,
-        "stuttgart": 5200,
-        "düsseldorf": 5000,
-        "cologne": 4800,
-        "köln": 4800,
-        "leipzig": 3200,
-        "dresden": 3500,
-    }
+    return _CITY_PRICES_CF.get(location.casefold(), DEFAULT_AVERAGE_PRICE_PER_SQM)
 
-    return city_prices.get(location.lower(), 4500)  # Default average
+
+@lru_cache(maxsize=256)
+def _acquisition_rates_for(location: Optional[str]) -> Tuple[float, float]:
+    """
+    Resolve acquisition cost rates for a location.
+
+    Returns:
+        Tuple of transfer tax rate (percent) and the combined transfer tax
+        plus notary fee ratio applied to the purchase price
+    """
+    if not location:
+        return _DEFAULT_ACQUISITION_RATES
+    return _ACQUISITION_RATES_BY_REGION.get(
+        location.casefold(), _DEFAULT_ACQUISITION_RATES
+    )
 
 
 # Export all tools
-__all__ = ["search_properties", "get_property_details", "calculate_investment_return"]
+__all__ = [
+    "search_properties",
+    "get_property_details",
+    "calculate_investment_return",
+    "calculate_investment_return_batch",
+]
@@ -14,7 +14,7 @@ import os
 import sys
 import logging
 from pathlib import Path
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 from datetime import datetime
 
 import uvicorn
@@ -58,6 +58,43 @@ os.environ.setdefault("GOOGLE_GENAI_USE_VERTEXAI", "True")
 os.environ.setdefault("GOOGLE_CLOUD_LOCATION", "europe-west3")
 
 
+# Constant parts of the ElevenLabs streaming request; only the text, model,
+# voice and API key vary per call
+_TTS_HEADERS = {
+    "Accept": "audio/mpeg",
+    "Content-Type": "application/json",
+}
+_TTS_VOICE_SETTINGS = {
+    "stability": 0.5,
+    "similarity_boost": 0.75,
+    "style": 0.0,
+    "use_speaker_boost": True,
+}
+
+# Shared HTTP client so TTS requests reuse pooled keep-alive connections
+# instead of paying a TCP/TLS handshake to ElevenLabs on every call
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared async HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client on application shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 class TTSRequest(BaseModel):
     """Text-to-speech request model."""
 
@@ -98,35 +135,24 @@ async def stream_tts_audio(
 
     url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}/stream"
 
-    headers = {
-        "Accept": "audio/mpeg",
-        "Content-Type": "application/json",
-        "xi-api-key": api_key,
-    }
+    headers = {**_TTS_HEADERS, "xi-api-key": api_key}
 
     data = {
         "text": text,
         "model_id": model_id,
-        "voice_settings": {
-            "stability": 0.5,
-            "similarity_boost": 0.75,
-            "style": 0.0,
-            "use_speaker_boost": True,
-        },
+        "voice_settings": _TTS_VOICE_SETTINGS,
         "output_format": "mp3_22050_32",
     }
 
     try:
-        async with httpx.AsyncClient() as client:
-            async with client.stream(
-                "POST", url, json=data, headers=headers, timeout=30.0
-            ) as response:
-                if response.status_code == 200:
-                    async for chunk in response.aiter_bytes(chunk_size=1024):
-                        yield chunk
-                else:
-                    logger.error(f"ElevenLabs API error: {response.status_code}")
-                    yield b""
+        client = get_http_client()
+        async with client.stream("POST", url, json=data, headers=headers) as response:
+            if response.status_code == 200:
+                async for chunk in response.aiter_bytes(chunk_size=1024):
+                    yield chunk
+            else:
+                logger.error(f"ElevenLabs API error: {response.status_code}")
+                yield b""
     except Exception as e:
         logger.error(f"TTS streaming error: {str(e)}")
         yield b""
@@ -151,6 +177,7 @@ def create_app() -> FastAPI:
         description="Multi-agent system for real estate assistance with ADK integration",
         version="1.0.0",
     )
+    main_app.add_event_handler("shutdown", close_http_client)
 
     # Create ADK FastAPI app with standard configuration
     # ADK automatically handles session management and conversation persistence